@@ -1,12 +1,27 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request
 from flask_cors import CORS
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
+import ijson
 import os
-import pandas as pd
+import queue
+import re
+import threading
+import time
+from cachetools import TTLCache
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 import numpy as np
+from numba import njit
 import pickle
 import xgboost as xgb
 import shap
+try:
+    import tl2cgen
+except ImportError:
+    tl2cgen = None
 from datetime import datetime
 
 app = Flask(__name__)
@@ -14,146 +29,477 @@ CORS(app)
 
 # Set up Etherscan API
 os.environ["ETHERSCAN_API_KEY"] = "SP28UE81KFS6CVMWM7BSM28TH51T2XNTK6"
-BASE_URL = "https://api.etherscan.io/api"
+BASE_URL = "https://api.etherscan.io/v2/api"
+CHAIN_ID = 1
 
-def fetch_wallet_transactions(address: str) -> list:
+# Etherscan caps page * offset at 10,000 records for txlist
+PAGE_SIZE = 1000
+MAX_PAGES = 10
+
+# Transaction values are aggregated as integer gwei; int64 wei would overflow
+# above ~9.2 ETH per transaction, while int64 gwei covers the whole supply
+WEI_PER_GWEI = 10**9
+GWEI_PER_ETH = 1e9
+
+# Pages requested at once after the first; kept under Etherscan's free-tier
+# calls-per-second limit
+FETCH_WAVE = 2
+
+# Etherscan answers rate limiting with HTTP 200 and status "0", which the
+# HTTP Retry policy can't see, so those replies are retried with backoff here
+RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_BACKOFF = 0.5
+
+# Pooled keep-alive session shared by all Etherscan calls
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+# Ethereum address: 0x followed by 40 hex digits
+ADDR_RE = re.compile(r'^0x[0-9a-fA-F]{40}$')
+
+# Wallets with fewer transactions than this are not scored; the model is noise on them
+MIN_TX_FOR_MODEL = 2
+
+# Recent analysis results keyed by lowercased address
+RESULT_CACHE = TTLCache(maxsize=10000, ttl=300)
+CACHE_LOCK = threading.Lock()
+CACHE_STATS = {'hits': 0, 'misses': 0}
+
+# Worker pool used to fetch the remaining pages of large wallets concurrently
+FETCH_POOL = ThreadPoolExecutor(max_workers=8)
+
+# Load the saved model, normalizer and SHAP explainer once per process
+try:
+    with open('scam_normalizer.pkl', 'rb') as f:
+        NORM = pickle.load(f)
+    with open('scam_model.pkl', 'rb') as f:
+        XGB_MODEL = pickle.load(f)
+    # Opt in to GPU tree traversal on hosts with a CUDA-enabled XGBoost build
+    if os.environ.get('USE_GPU') == '1':
+        XGB_MODEL.set_params(device='cuda')
+    # Exact path-dependent TreeSHAP needs no background data
+    EXPLAINER = shap.TreeExplainer(XGB_MODEL, feature_perturbation='tree_path_dependent')
+    BOOSTER = XGB_MODEL.get_booster()
+except Exception as e:
+    print(f"Model loading error: {e}")
+    NORM, XGB_MODEL, EXPLAINER, BOOSTER = None, None, None, None
+
+class ShapBatcher:
+    """
+    Collects single-row SHAP requests on a background thread and explains
+    them together, waiting at most max_wait seconds to fill a batch
+    """
+
+    def __init__(self, explainer, max_batch=64, max_wait=0.005):
+        self.explainer = explainer
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._pending = queue.Queue()
+        threading.Thread(target=self._run, name='shap-batcher', daemon=True).start()
+
+    def submit(self, row):
+        """Queue a (1, n_features) row; the future resolves to its SHAP values"""
+        future = Future()
+        # Copy, since callers reuse their input buffers
+        self._pending.put((np.array(row, copy=True), future))
+        return future
+
+    def _run(self):
+        while True:
+            batch = [self._pending.get()]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._pending.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                shap_values = self.explainer.shap_values(
+                    np.vstack([row for row, _ in batch]), check_additivity=False
+                )
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            for values, (_, future) in zip(shap_values, batch):
+                future.set_result(values)
+
+BATCHER = ShapBatcher(EXPLAINER) if EXPLAINER is not None else None
+
+# Natively compiled copy of the model (see compile_model.py, needs the optional
+# treelite/tl2cgen packages); XGB_MODEL stays loaded for SHAP
+PREDICTOR = None
+if tl2cgen is not None and os.path.exists('scam_model.so'):
+    try:
+        PREDICTOR = tl2cgen.Predictor('scam_model.so', nthread=1)
+    except Exception as e:
+        print(f"Compiled model loading error: {e}")
+
+def _power_params(norm):
+    """
+    Pull the learned Yeo-Johnson lambdas and standardization out of a fitted
+    PowerTransformer for _apply_power; (None, None, None) if it can't be used
+    """
+    if norm is None or getattr(norm, 'method', None) != 'yeo-johnson':
+        return None, None, None
+    lambdas = norm.lambdas_.astype(np.float64)
+    if norm.standardize:
+        return lambdas, norm._scaler.mean_.astype(np.float64), norm._scaler.scale_.astype(np.float64)
+    return lambdas, np.zeros_like(lambdas), np.ones_like(lambdas)
+
+# Normalizer parameters applied in place by _apply_power; None falls back to NORM.transform
+NORM_LAMBDAS, NORM_MEAN, NORM_SCALE = _power_params(NORM)
+
+# Process-wide pool of (1, n_features) float32 model input rows. A pool
+# rather than threading.local, which gevent turns into a per-greenlet (and
+# so per-connection) local; it holds one row per concurrent prediction
+_BUFFER_POOL = queue.SimpleQueue()
+
+def _new_columns(size):
+    """Allocate typed per-transaction columns for `size` transactions"""
+    return {
+        'from': np.empty(size, dtype='U42'),
+        'to': np.empty(size, dtype='U42'),
+        'value': np.empty(size, dtype=np.int64),
+        'timestamp': np.empty(size, dtype=np.int64),
+        'input_nonempty': np.empty(size, dtype=np.bool_),
+        'to_empty': np.empty(size, dtype=np.bool_),
+    }
+
+class _HeadRecorder:
+    """
+    File wrapper that keeps the first `limit` bytes read through it, so the
+    short body of an Etherscan error reply can be decoded after streaming
+    """
+
+    def __init__(self, raw, limit=65536):
+        self.raw = raw
+        self.limit = limit
+        self.head = bytearray()
+
+    def read(self, size=-1):
+        data = self.raw.read(size)
+        if len(self.head) < self.limit:
+            self.head += data[:self.limit - len(self.head)]
+        return data
+
+def _store_tx(columns, n, tx):
+    """Write one Etherscan transaction dict into row n of the columns"""
+    to = tx['to'] or ''
+    columns['from'][n] = tx['from']
+    columns['to'][n] = to
+    columns['value'][n] = int(tx['value']) // WEI_PER_GWEI
+    columns['timestamp'][n] = int(tx['timeStamp'])
+    # Length checks instead of string comparisons: call data is more than '0x',
+    # and contract creations have no recipient
+    columns['input_nonempty'][n] = len(tx['input']) > 2
+    columns['to_empty'][n] = len(to) == 0
+
+def _fetch_page(address: str, page: int) -> dict:
+    """
+    Fetch a single page of normal transactions from Etherscan, streaming the
+    JSON body straight into typed columns as each transaction is parsed
+    """
+    params = {
+        'chainid': CHAIN_ID,
+        'module': 'account',
+        'action': 'txlist',
+        'address': address,
+        'startblock': 0,
+        'endblock': 99999999,
+        'page': page,
+        'offset': PAGE_SIZE,
+        'sort': 'asc',
+        'apikey': os.environ['ETHERSCAN_API_KEY'],
+    }
+    for attempt in range(RATE_LIMIT_RETRIES + 1):
+        columns = _new_columns(PAGE_SIZE)
+        n = 0
+        with SESSION.get(BASE_URL, params=params, timeout=(3, 15), stream=True) as response:
+            response.raw.decode_content = True
+            body = _HeadRecorder(response.raw)
+            for tx in ijson.items(body, 'result.item'):
+                if n == columns['timestamp'].size:
+                    columns = {k: np.resize(v, 2 * v.size) for k, v in columns.items()}
+                _store_tx(columns, n, tx)
+                n += 1
+
+        # Transactions only come back with status "1"
+        if n:
+            return {k: v[:n] for k, v in columns.items()}
+
+        # Empty and error replies are short, so the recorded head is the whole body
+        try:
+            data = orjson.loads(body.head)
+        except orjson.JSONDecodeError:
+            raise ValueError("Malformed response from Etherscan") from None
+        fields = {k: v for k, v in data.items() if isinstance(v, str)}
+
+        if fields.get("status") == "1":
+            return _new_columns(0)
+
+        # If no transactions found, treat as normal account (not flagged)
+        if fields.get("message", "").lower().startswith("no transactions"):
+            return _new_columns(0)
+
+        if "rate limit" in fields.get("result", "").lower() and attempt < RATE_LIMIT_RETRIES:
+            time.sleep(RATE_LIMIT_BACKOFF * 2 ** attempt)
+            continue
+
+        raise ValueError(f"Error from Etherscan: {fields.get('message')} ({fields.get('result')})")
+
+def fetch_wallet_transactions(address: str) -> dict:
     """
     Fetches all normal transactions for an Ethereum wallet from Etherscan.
-    Returns a list of transactions as dictionaries (ready for feature extraction).
+    Returns a dict of per-transaction NumPy columns (see _new_columns), in
+    block order and ready for feature extraction.
     """
     try:
-        url = (
-            f"{BASE_URL}?module=account&action=txlist"
-            f"&address={address}&startblock=0&endblock=99999999"
-            f"&sort=asc&apikey={os.environ['ETHERSCAN_API_KEY']}"
-        )
-        response = requests.get(url)
-        data = response.json()
-
-        if data["status"] != "1":
-            # If no transactions found, treat as normal account (not flagged)
-            if data["message"].lower().startswith("no transactions"):
-                return []
-            raise ValueError(f"Error from Etherscan: {data['message']}")
-
-        return data["result"]
+        # The first page tells us whether the wallet needs any more pages
+        first = _fetch_page(address, 1)
+        if first['timestamp'].size < PAGE_SIZE:
+            return first
+
+        # Fetch the remaining pages in small concurrent waves, keeping them in
+        # page order; a short page means there is nothing left to fetch
+        pages = [first]
+        for wave_start in range(2, MAX_PAGES + 1, FETCH_WAVE):
+            wave = range(wave_start, min(wave_start + FETCH_WAVE, MAX_PAGES + 1))
+            futures = [FETCH_POOL.submit(_fetch_page, address, page) for page in wave]
+            for future in futures:
+                pages.append(future.result())
+                if pages[-1]['timestamp'].size < PAGE_SIZE:
+                    break
+            if pages[-1]['timestamp'].size < PAGE_SIZE:
+                # Drop any page of this wave that hasn't started yet
+                for future in futures:
+                    future.cancel()
+                break
+
+        return {k: np.concatenate([p[k] for p in pages]) for k in first}
 
     except Exception as e:
         # Only raise if not the 'no transactions found' case
         if "no transactions found" in str(e).lower():
-            return []
+            return _new_columns(0)
         raise RuntimeError(f"Failed to fetch transactions: {e}")
 
-def extract_features_from_etherscan(tx_list, address):
-    """Extract features from transaction list for fraud detection"""
-    if not tx_list:
-        # Return default features for a new/empty account
-        features = pd.DataFrame([{k: 0 for k in [
-            "Avg min between sent tnx", "Avg min between received tnx", "Time Diff between first and last (Mins)",
-            "Sent tnx", "Received Tnx", "Number of Created Contracts", "Unique Received From Addresses",
-            "Unique Sent To Addresses", "min value received", "max value received ", "avg val received",
-            "min val sent", "max val sent", "avg val sent", "min value sent to contract",
-            "max val sent to contract", "avg value sent to contract", "total transactions (including tnx to create contract",
-            "total Ether sent", "total ether received", "total ether balance"
-        ]}])
+# Model input columns, in the order the normalizer and model were trained on
+FEATURE_ORDER = (
+    "Avg min between sent tnx", "Avg min between received tnx", "Time Diff between first and last (Mins)",
+    "Sent tnx", "Received Tnx", "Number of Created Contracts", "Unique Received From Addresses",
+    "Unique Sent To Addresses", "min value received", "max value received ", "avg val received",
+    "min val sent", "max val sent", "avg val sent", "min value sent to contract",
+    "max val sent to contract", "avg value sent to contract", "total transactions (including tnx to create contract",
+    "total Ether sent", "total ether received", "total ether balance"
+)
+
+def _address_id(addresses, address):
+    """Look up the interned id of an address, -1 if it never appears"""
+    pos = np.searchsorted(addresses, address)
+    if pos < addresses.size and addresses[pos] == address:
+        return int(pos)
+    return -1
+
+@njit(cache=True, fastmath=True)
+def _compute_features(from_ids, to_ids, values, timestamps, input_nonempty, to_empty, addr_id):
+    """
+    Compute all model features in one pass over the transaction columns.
+    values are integer gwei, so sums/min/max are exact; they are converted
+    to ETH only when writing the output. timestamps are unix seconds and
+    need not be sorted: the mean gap between consecutive sorted timestamps
+    is (last - first) / (count - 1), so only the extremes are tracked.
+    Returns a float64 array laid out in FEATURE_ORDER.
+    """
+    n = timestamps.size
+    sent_to = np.empty(n, dtype=np.int64)
+    received_from = np.empty(n, dtype=np.int64)
+
+    n_sent = n_received = n_contract = n_created = 0
+    sent_sum = received_sum = contract_sum = 0
+    sent_min = sent_max = received_min = received_max = contract_min = contract_max = 0
+    sent_first = sent_last = received_first = received_last = 0
+
+    for i in range(n):
+        v = values[i]
+        ts = timestamps[i]
+        if from_ids[i] == addr_id:
+            if n_sent == 0:
+                sent_min = sent_max = v
+                sent_first = sent_last = ts
+            else:
+                sent_min = min(sent_min, v)
+                sent_max = max(sent_max, v)
+                sent_first = min(sent_first, ts)
+                sent_last = max(sent_last, ts)
+            sent_to[n_sent] = to_ids[i]
+            sent_sum += v
+            n_sent += 1
+
+            n_created += to_empty[i]
+
+            if input_nonempty[i]:
+                if n_contract == 0:
+                    contract_min = contract_max = v
+                else:
+                    contract_min = min(contract_min, v)
+                    contract_max = max(contract_max, v)
+                contract_sum += v
+                n_contract += 1
+
+        if to_ids[i] == addr_id:
+            if n_received == 0:
+                received_min = received_max = v
+                received_first = received_last = ts
+            else:
+                received_min = min(received_min, v)
+                received_max = max(received_max, v)
+                received_first = min(received_first, ts)
+                received_last = max(received_last, ts)
+            received_from[n_received] = from_ids[i]
+            received_sum += v
+            n_received += 1
+
+    out = np.zeros(21, dtype=np.float64)
+    if n_sent > 1:
+        out[0] = (sent_last - sent_first) / (n_sent - 1) / 60
+    if n_received > 1:
+        out[1] = (received_last - received_first) / (n_received - 1) / 60
+    if n > 0:
+        out[2] = (timestamps.max() - timestamps.min()) / 60
+    out[3] = n_sent
+    out[4] = n_received
+    out[5] = n_created
+    out[6] = np.unique(received_from[:n_received]).size
+    out[7] = np.unique(sent_to[:n_sent]).size
+    if n_received > 0:
+        out[8] = received_min / GWEI_PER_ETH
+        out[9] = received_max / GWEI_PER_ETH
+        out[10] = received_sum / n_received / GWEI_PER_ETH
+    if n_sent > 0:
+        out[11] = sent_min / GWEI_PER_ETH
+        out[12] = sent_max / GWEI_PER_ETH
+        out[13] = sent_sum / n_sent / GWEI_PER_ETH
+    if n_contract > 0:
+        out[14] = contract_min / GWEI_PER_ETH
+        out[15] = contract_max / GWEI_PER_ETH
+        out[16] = contract_sum / n_contract / GWEI_PER_ETH
+    out[17] = n
+    out[18] = sent_sum / GWEI_PER_ETH
+    out[19] = received_sum / GWEI_PER_ETH
+    out[20] = (received_sum - sent_sum) / GWEI_PER_ETH
+    return out
+
+def extract_features_from_etherscan(transactions, address):
+    """
+    Extract features from transaction columns for fraud detection
+    address must be lowercased to match the Etherscan transaction fields
+    Returns a (1, n_features) float32 array with columns in FEATURE_ORDER
+    """
+    features = np.zeros((1, len(FEATURE_ORDER)), dtype=np.float32)
+    n = transactions['timestamp'].size
+    if n == 0:
+        # Default features for a new/empty account
         return features
 
-    df = pd.DataFrame(tx_list)
-    df['timestamp'] = pd.to_datetime(df['timeStamp'].astype(int), unit='s')
-    df['value_eth'] = df['value'].astype(float) / 1e18
-    df = df.sort_values('timestamp')
-
-    # Basic filters
-    sent = df[df['from'].str.lower() == address.lower()]
-    received = df[df['to'].str.lower() == address.lower()]
-
-    # Times
-    avg_time_sent = sent['timestamp'].diff().dt.total_seconds().dropna().mean() / 60 if len(sent) > 1 else 0
-    avg_time_received = received['timestamp'].diff().dt.total_seconds().dropna().mean() / 60 if len(received) > 1 else 0
-    time_diff_total = (df['timestamp'].max() - df['timestamp'].min()).total_seconds() / 60
-
-    # Value stats
-    min_received = received['value_eth'].min() if not received.empty else 0
-    max_received = received['value_eth'].max() if not received.empty else 0
-    avg_received = received['value_eth'].mean() if not received.empty else 0
-
-    min_sent = sent['value_eth'].min() if not sent.empty else 0
-    max_sent = sent['value_eth'].max() if not sent.empty else 0
-    avg_sent = sent['value_eth'].mean() if not sent.empty else 0
-
-    # Unique address counts
-    uniq_received_from = received['from'].nunique()
-    uniq_sent_to = sent['to'].nunique()
-
-    # Contract interactions
-    sent_contracts = sent[sent['input'] != '0x']
-    avg_val_sent_to_contract = sent_contracts['value_eth'].mean() if not sent_contracts.empty else 0
-    min_val_sent_to_contract = sent_contracts['value_eth'].min() if not sent_contracts.empty else 0
-    max_val_sent_to_contract = sent_contracts['value_eth'].max() if not sent_contracts.empty else 0
-
-    # Aggregates
-    total_tx = len(df)
-    total_eth_sent = sent['value_eth'].sum()
-    total_eth_received = received['value_eth'].sum()
-    total_balance = total_eth_received - total_eth_sent
-
-    return pd.DataFrame([{
-        "Avg min between sent tnx": avg_time_sent,
-        "Avg min between received tnx": avg_time_received,
-        "Time Diff between first and last (Mins)": time_diff_total,
-        "Sent tnx": len(sent),
-        "Received Tnx": len(received),
-        "Number of Created Contracts": sum((sent['to'] == '') | (sent['to'].isna())),
-        "Unique Received From Addresses": uniq_received_from,
-        "Unique Sent To Addresses": uniq_sent_to,
-        "min value received": min_received,
-        "max value received ": max_received,
-        "avg val received": avg_received,
-        "min val sent": min_sent,
-        "max val sent": max_sent,
-        "avg val sent": avg_sent,
-        "min value sent to contract": min_val_sent_to_contract,
-        "max val sent to contract": max_val_sent_to_contract,
-        "avg value sent to contract": avg_val_sent_to_contract,
-        "total transactions (including tnx to create contract": total_tx,
-        "total Ether sent": total_eth_sent,
-        "total ether received": total_eth_received,
-        "total ether balance": total_balance
-    }])
+    # Intern addresses to dense integer ids so the kernel only compares ints
+    addresses, ids = np.unique(
+        np.concatenate((transactions['from'], transactions['to'])), return_inverse=True
+    )
+
+    features[0] = _compute_features(
+        ids[:n], ids[n:], transactions['value'], transactions['timestamp'],
+        transactions['input_nonempty'], transactions['to_empty'], _address_id(addresses, address)
+    )
+    return features
+
+@contextmanager
+def _input_buffer():
+    """Borrow a preallocated float32 model input row from the process-wide pool"""
+    try:
+        buf = _BUFFER_POOL.get_nowait()
+    except queue.Empty:
+        buf = np.empty((1, len(FEATURE_ORDER)), dtype=np.float32)
+    try:
+        yield buf
+    finally:
+        _BUFFER_POOL.put(buf)
+
+@njit(cache=True)
+def _apply_power(x, lambdas, mean, scale, out):
+    """Yeo-Johnson transform and standardize one row of features into out"""
+    for j in range(x.size):
+        v = np.float64(x[j])
+        lmb = lambdas[j]
+        if v >= 0:
+            if abs(lmb) < 2.220446049250313e-16:
+                t = np.log1p(v)
+            else:
+                t = np.expm1(lmb * np.log1p(v)) / lmb
+        else:
+            if abs(lmb - 2) < 2.220446049250313e-16:
+                t = -np.log1p(-v)
+            else:
+                t = -np.expm1((2 - lmb) * np.log1p(-v)) / (2 - lmb)
+        out[j] = (t - mean[j]) / scale[j]
+
+def _normalize(features, out):
+    """Normalize a (1, n_features) row into the preallocated out row"""
+    if NORM_LAMBDAS is not None:
+        _apply_power(features[0], NORM_LAMBDAS, NORM_MEAN, NORM_SCALE, out[0])
+    else:
+        np.copyto(out, NORM.transform(features), casting='same_kind')
 
 def predict_scam(features):
     """
     Predict if wallet is fraudulent using trained model
+    features: (1, n_features) array in FEATURE_ORDER
     Returns: verdict and SHAP explanations
     """
     try:
         # If all features are zero, treat as normal (not flagged)
-        if (features == 0).all(axis=None):
+        if not features.any():
             return 'not flagged', [], 0.0
 
-        # Load the saved model and normalizer
-        with open('scam_normalizer.pkl', 'rb') as f:
-            norm = pickle.load(f)
-        with open('scam_model.pkl', 'rb') as f:
-            xgb_model = pickle.load(f)
+        if NORM is None or BOOSTER is None:
+            raise RuntimeError("Model files not loaded (scam_model.pkl / scam_normalizer.pkl)")
 
-        # Normalize features
-        norm_features = norm.transform(features)
-        
-        # Make prediction
-        prediction = xgb_model.predict(norm_features)[0]
-        prediction_proba = xgb_model.predict_proba(norm_features)[0]
-        confidence = float(max(prediction_proba))  # Convert to Python float
+        shap_future = None
+        with _input_buffer() as norm_features:
+            # Normalize features into the pooled float32 row
+            _normalize(features, norm_features)
+            
+            # Make prediction with a single pass over the forest
+            if PREDICTOR is not None:
+                proba = float(PREDICTOR.predict(tl2cgen.DMatrix(norm_features)).ravel()[0])
+            else:
+                # A single row is fastest on one thread
+                dm = xgb.DMatrix(norm_features, feature_names=BOOSTER.feature_names, nthread=1)
+                proba = float(BOOSTER.predict(dm)[0])
+            prediction = int(proba >= 0.5)
+            confidence = proba if prediction else 1 - proba
+
+            verdict = 'flagged' if prediction == 1 else 'not flagged'
 
-        verdict = 'flagged' if prediction == 1 else 'not flagged'
+            # Queue SHAP for flagged addresses; the batcher copies the row
+            if verdict == 'flagged':
+                shap_future = BATCHER.submit(norm_features)
         
         # Get SHAP explanations for flagged addresses
         top_features = []
-        if verdict == 'flagged':
+        if shap_future is not None:
             try:
-                explainer = shap.TreeExplainer(xgb_model)
-                shap_values = explainer.shap_values(norm_features)
-                feature_contributions = dict(zip(features.columns, shap_values[0]))
+                shap_values = shap_future.result(timeout=0.25)
+                feature_contributions = dict(zip(FEATURE_ORDER, shap_values))
                 sorted_contrib = sorted(feature_contributions.items(), key=lambda x: abs(x[1]), reverse=True)
                 # Convert SHAP values to Python floats
                 top_features = [(feature, float(impact)) for feature, impact in sorted_contrib[:3]]
@@ -167,13 +513,49 @@ def predict_scam(features):
         print(f"Prediction error: {e}")
         return 'error', [], 0.0
 
-def predict_address_scam(address: str):
+def predict_address_scam(address: str, use_cache: bool = True):
     """
     Main function to analyze an Ethereum address for fraud
+    Expects a validated, lowercased address (as Etherscan returns them)
+    Successful results are cached for a few minutes per address
+    """
+    if use_cache:
+        with CACHE_LOCK:
+            cached = RESULT_CACHE.get(address)
+            if cached is not None:
+                CACHE_STATS['hits'] += 1
+                return cached
+            CACHE_STATS['misses'] += 1
+
+    result = _analyze_address(address)
+
+    # A flagged result always carries explanations unless SHAP failed or
+    # timed out; don't pin that degraded answer in the cache
+    explanations_missing = result['verdict'] == 'flagged' and not result['explanations']
+    if result['verdict'] != 'error' and not explanations_missing:
+        with CACHE_LOCK:
+            RESULT_CACHE[address] = result
+    return result
+
+def _analyze_address(address: str):
+    """
+    Fetch, featurize and score an address without consulting the cache
     """
     try:
         # Fetch transactions
         transactions = fetch_wallet_transactions(address)
+        tx_count = transactions['timestamp'].size
+        
+        # Too little history to score, skip feature extraction and the model
+        if tx_count < MIN_TX_FOR_MODEL:
+            return {
+                'address': address,
+                'verdict': 'not flagged',
+                'confidence': 0.0,
+                'reason': 'insufficient_data',
+                'explanations': [],
+                'transaction_count': tx_count
+            }
         
         # Extract features
         features = extract_features_from_etherscan(transactions, address)
@@ -181,36 +563,14 @@ def predict_address_scam(address: str):
         # Make prediction
         verdict, explanations, confidence = predict_scam(features)
         
-        # Convert numpy types to Python native types for JSON serialization
-        def convert_numpy_types(obj):
-            if isinstance(obj, np.float32) or isinstance(obj, np.float64):
-                return float(obj)
-            elif isinstance(obj, np.int32) or isinstance(obj, np.int64):
-                return int(obj)
-            elif isinstance(obj, dict):
-                return {k: convert_numpy_types(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [convert_numpy_types(item) for item in obj]
-            elif isinstance(obj, tuple):
-                return tuple(convert_numpy_types(item) for item in obj)
-            return obj
-        
-        # Convert features to regular Python types
-        features_dict = {}
-        if not features.empty:
-            features_dict = {k: convert_numpy_types(v) for k, v in features.iloc[0].to_dict().items()}
-        
-        # Convert explanations to regular Python types
-        explanations_converted = []
-        for feature, impact in explanations:
-            explanations_converted.append([feature, float(impact)])
+        features_dict = dict(zip(FEATURE_ORDER, features[0].tolist()))
         
         return {
             'address': address,
             'verdict': verdict,
             'confidence': float(confidence),
-            'explanations': explanations_converted,
-            'transaction_count': len(transactions),
+            'explanations': explanations,
+            'transaction_count': tx_count,
             'features': features_dict
         }
     
@@ -222,15 +582,70 @@ def predict_address_scam(address: str):
             'confidence': 0.0
         }
 
+def ojson(obj, status=200):
+    """Serialize a response body with orjson, handling numpy types in C"""
+    return Response(
+        orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS),
+        status=status,
+        mimetype='application/json'
+    )
+
+def _warmup():
+    """
+    Exercise the Numba kernel, normalizer, model and SHAP explainer once at
+    startup so the first real request doesn't pay for JIT and lazy setup
+    """
+    global NORM_LAMBDAS, PREDICTOR
+    try:
+        ids = np.zeros(2, dtype=np.int64)
+        flags = np.zeros(2, dtype=np.bool_)
+        _compute_features(ids, ids, ids, ids, flags, flags, 0)
+
+        if NORM is None or BOOSTER is None:
+            return
+        # The in-place normalizer must agree with the fitted PowerTransformer
+        probe = np.linspace(-10, 1000, len(FEATURE_ORDER), dtype=np.float32).reshape(1, -1)
+        row = np.empty_like(probe)
+        _normalize(probe, row)
+        if NORM_LAMBDAS is not None and not np.allclose(row, NORM.transform(probe), rtol=1e-6, atol=1e-6):
+            print("Warmup: fast normalizer disagrees with PowerTransformer, using NORM.transform")
+            NORM_LAMBDAS = None
+
+        BOOSTER.predict(xgb.DMatrix(row, feature_names=BOOSTER.feature_names, nthread=1))
+
+        # The compiled model must be the same model as scam_model.pkl, which
+        # still drives SHAP; a stale scam_model.so would give other verdicts
+        if PREDICTOR is not None:
+            probes = np.random.default_rng(0).normal(size=(64, len(FEATURE_ORDER))).astype(np.float32)
+            compiled = PREDICTOR.predict(tl2cgen.DMatrix(probes)).ravel()
+            native = BOOSTER.predict(xgb.DMatrix(probes, feature_names=BOOSTER.feature_names, nthread=1))
+            if not np.allclose(compiled, native, rtol=1e-5, atol=1e-5):
+                print("Warmup: scam_model.so disagrees with scam_model.pkl, re-run compile_model.py; using XGBoost")
+                PREDICTOR = None
+        BATCHER.submit(row).result()
+    except Exception as e:
+        print(f"Warmup error: {e}")
+
+_warmup()
+
+def _valid(address):
+    """Check that a string is a well-formed Ethereum address"""
+    return ADDR_RE.fullmatch(address) is not None
+
 @app.route('/')
 def health_check():
     """Health check endpoint"""
-    return jsonify({
+    return ojson({
         'status': 'healthy',
         'message': 'Blockchain Fraud Detection API is running',
         'endpoints': {
             'analyze': '/api/analyze',
             'health': '/'
+        },
+        'cache': {
+            'size': len(RESULT_CACHE),
+            'hits': CACHE_STATS['hits'],
+            'misses': CACHE_STATS['misses']
         }
     })
 
@@ -241,47 +656,47 @@ def analyze_address():
         data = request.get_json()
         
         if not data or 'address' not in data:
-            return jsonify({
+            return ojson({
                 'error': 'Missing address in request body'
-            }), 400
+            }, 400)
         
         address = data['address'].strip()
         
-        # Basic address validation
-        if not address.startswith('0x') or len(address) != 42:
-            return jsonify({
+        # Reject malformed addresses before doing any work
+        if not _valid(address):
+            return ojson({
                 'error': 'Invalid Ethereum address format'
-            }), 400
+            }, 400)
         
-        # Analyze the address
-        result = predict_address_scam(address)
+        # Analyze the address (?nocache=1 forces a fresh analysis)
+        result = predict_address_scam(address.lower(), use_cache=request.args.get('nocache') != '1')
         
-        return jsonify(result)
+        return ojson(result)
     
     except Exception as e:
-        return jsonify({
+        return ojson({
             'error': f'Server error: {str(e)}'
-        }), 500
+        }, 500)
 
 @app.route('/api/analyze/<address>', methods=['GET'])
 def analyze_address_get(address):
     """Analyze a wallet address for fraud via GET request"""
     try:
-        # Basic address validation
-        if not address.startswith('0x') or len(address) != 42:
-            return jsonify({
+        # Reject malformed addresses before doing any work
+        if not _valid(address):
+            return ojson({
                 'error': 'Invalid Ethereum address format'
-            }), 400
+            }, 400)
         
-        # Analyze the address
-        result = predict_address_scam(address)
+        # Analyze the address (?nocache=1 forces a fresh analysis)
+        result = predict_address_scam(address.lower(), use_cache=request.args.get('nocache') != '1')
         
-        return jsonify(result)
+        return ojson(result)
     
     except Exception as e:
-        return jsonify({
+        return ojson({
             'error': f'Server error: {str(e)}'
-        }), 500
+        }, 500)
 
 if __name__ == '__main__':
     print("Starting Blockchain Fraud Detection API...")
@@ -289,5 +704,7 @@ if __name__ == '__main__':
     print("API will be available at: http://localhost:5001")
     print("Health check: http://localhost:5001")
     print("Analyze endpoint: http://localhost:5001/api/analyze")
+    print("This is the single-threaded development server; for production run:")
+    print("  gunicorn -k gevent -w 4 --worker-connections 1000 -b 0.0.0.0:5001 wsgi:app")
     
     app.run(debug=True, host='0.0.0.0', port=5001)
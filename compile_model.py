@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Compile the trained XGBoost fraud model into a native shared library
+Produces scam_model.so, which app.py loads for prediction when present
+Requires the optional treelite and tl2cgen packages; re-run after every retrain
+"""
+
+import pickle
+
+import treelite
+import tl2cgen
+
+
+def main():
+    with open('scam_model.pkl', 'rb') as f:
+        xgb_model = pickle.load(f)
+
+    model = treelite.frontend.from_xgboost(xgb_model.get_booster())
+    tl2cgen.export_lib(model, toolchain='gcc', libpath='scam_model.so',
+                       params={'parallel_comp': 32, 'quantize': 1})
+
+    print("✅ Compiled model saved as 'scam_model.so'")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""
+Guard the hand-written feature and normalizer kernels in app.py against the
+pandas / sklearn implementations they replaced, so kernel edits can't
+silently change the model inputs
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.preprocessing import PowerTransformer
+
+import app
+
+ADDRESS = '0x' + 'a' * 40
+
+
+def reference_features(tx_list, address):
+    """Original pandas implementation of extract_features_from_etherscan"""
+    df = pd.DataFrame(tx_list)
+    df['timestamp'] = pd.to_datetime(df['timeStamp'].astype(int), unit='s')
+    df['value_eth'] = df['value'].astype(float) / 1e18
+    df = df.sort_values('timestamp')
+
+    sent = df[df['from'].str.lower() == address.lower()]
+    received = df[df['to'].str.lower() == address.lower()]
+
+    avg_time_sent = sent['timestamp'].diff().dt.total_seconds().dropna().mean() / 60 if len(sent) > 1 else 0
+    avg_time_received = received['timestamp'].diff().dt.total_seconds().dropna().mean() / 60 if len(received) > 1 else 0
+    time_diff_total = (df['timestamp'].max() - df['timestamp'].min()).total_seconds() / 60
+
+    sent_contracts = sent[sent['input'] != '0x']
+
+    def stat(frame, how):
+        return getattr(frame['value_eth'], how)() if not frame.empty else 0
+
+    return np.array([
+        avg_time_sent,
+        avg_time_received,
+        time_diff_total,
+        len(sent),
+        len(received),
+        sum((sent['to'] == '') | (sent['to'].isna())),
+        received['from'].nunique(),
+        sent['to'].nunique(),
+        stat(received, 'min'), stat(received, 'max'), stat(received, 'mean'),
+        stat(sent, 'min'), stat(sent, 'max'), stat(sent, 'mean'),
+        stat(sent_contracts, 'min'), stat(sent_contracts, 'max'), stat(sent_contracts, 'mean'),
+        len(df),
+        sent['value_eth'].sum(),
+        received['value_eth'].sum(),
+        received['value_eth'].sum() - sent['value_eth'].sum(),
+    ], dtype=np.float64)
+
+
+def random_wallet(rng, n):
+    """Unsorted Etherscan-style transactions touching ADDRESS, in whole gwei"""
+    others = ['0x%040x' % i for i in range(1, 25)]
+    txs = []
+    for _ in range(n):
+        kind = rng.random()
+        if kind < 0.45:
+            sender, recipient = ADDRESS, str(rng.choice(others + ['']))
+        elif kind < 0.95:
+            sender, recipient = str(rng.choice(others)), ADDRESS
+        else:
+            sender, recipient = ADDRESS, ADDRESS
+        txs.append({
+            'from': sender,
+            'to': recipient,
+            'value': str(int(rng.integers(0, 10**11)) * app.WEI_PER_GWEI),
+            'timeStamp': str(1600000000 + int(rng.integers(0, 10**7))),
+            'input': str(rng.choice(['0x', '0xa9059cbb'])),
+        })
+    return txs
+
+
+def to_columns(tx_list):
+    columns = app._new_columns(len(tx_list))
+    for n, tx in enumerate(tx_list):
+        app._store_tx(columns, n, tx)
+    return columns
+
+
+@pytest.mark.parametrize('seed', range(50))
+def test_features_match_pandas_reference(seed):
+    rng = np.random.default_rng(seed)
+    txs = random_wallet(rng, int(rng.integers(2, 400)))
+
+    features = app.extract_features_from_etherscan(to_columns(txs), ADDRESS)
+
+    assert features.shape == (1, len(app.FEATURE_ORDER))
+    assert features.dtype == np.float32
+    expected = reference_features(txs, ADDRESS).astype(np.float32)
+    np.testing.assert_allclose(features[0], expected, rtol=1e-6, atol=1e-9)
+
+
+def test_empty_wallet_has_zero_features():
+    features = app.extract_features_from_etherscan(app._new_columns(0), ADDRESS)
+    assert not features.any()
+
+
+def test_apply_power_matches_power_transformer():
+    rng = np.random.default_rng(0)
+    train = np.column_stack([
+        rng.lognormal(2, 1.5, 500),
+        rng.normal(-3, 2, 500),
+        rng.exponential(50, 500),
+        rng.normal(0, 1, 500) ** 3,
+    ])
+    norm = PowerTransformer().fit(train)
+    lambdas, mean, scale = app._power_params(norm)
+
+    rows = np.vstack([train[:200], rng.normal(0, 100, (200, train.shape[1]))])
+    out = np.empty(train.shape[1])
+    for row in rows:
+        app._apply_power(row, lambdas, mean, scale, out)
+        np.testing.assert_allclose(out, norm.transform(row[None, :])[0], rtol=1e-7, atol=1e-9)
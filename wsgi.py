@@ -0,0 +1,9 @@
+"""
+WSGI entry point for serving the fraud detection API in production
+Run with: gunicorn -k gevent -w 4 --worker-connections 1000 -b 0.0.0.0:5001 wsgi:app
+"""
+
+from app import app
+
+if __name__ == '__main__':
+    app.run(host='0.0.0.0', port=5001)